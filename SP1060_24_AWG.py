@@ -2,6 +2,7 @@ from typing import Optional, Sequence, Dict, Tuple, Any, Union, List
 import time
 import pyvisa as visa
 import logging
+import numpy as np
 from functools import partial
 from qcodes import VisaInstrument, InstrumentChannel, ChannelList
 from qcodes.instrument.channel import MultiChannelInstrumentParameter
@@ -12,6 +13,10 @@ import Parameterhelp as ph
 import os
 log = logging.getLogger(__name__)
 
+# dacval=(Vout+10)*_DAC_SCALE
+_DAC_SCALE = 838860.75
+_DAC_SCALE_INV = 1.0/_DAC_SCALE
+
 class SP1060Exception(Exception):
     pass
 
@@ -22,22 +27,30 @@ class SP1060Reader(object):
         Convert voltage to DAC value 
         dacval=(Vout+10)*838860.75 
         """
-        try:
-            dacval = int((float(vval)+10)*838860.75 )
-            return dacval
-        except:
-            pass
+        vval = float(vval)
+        return int((vval + 10.0)*_DAC_SCALE)
 
     def _dacval_to_vval(self, dacval):
         """
         Convert DAC value to voltage
         Vout=(dacval/838860.75 )–10
         """
-        try:
-            vval = round((int(dacval.strip(),16)/float(838860.75))-10, 6)
-            return vval
-        except:
-            pass
+        return round(int(dacval, 16)*_DAC_SCALE_INV - 10.0, 6)
+
+    def _dacvals_to_vvals(self, dacvals):
+        """
+        Convert a sequence of DAC values to voltages in one go
+        Vout=(dacval/838860.75 )–10
+        """
+        arr = np.fromiter((int(s, 16) for s in dacvals), dtype=np.int64, count=len(dacvals))
+        return (arr*_DAC_SCALE_INV - 10.0).round(6)
+
+    def _vvals_to_dacvals(self, vvals):
+        """
+        Convert an array of voltages to DAC values in one go
+        dacval=(Vout+10)*838860.75
+        """
+        return ((np.asarray(vvals, dtype=float) + 10.0)*_DAC_SCALE).astype(np.int64)
 
 
 class SP1060MultiChannel(MultiChannelInstrumentParameter, SP1060Reader):
@@ -45,14 +58,56 @@ class SP1060MultiChannel(MultiChannelInstrumentParameter, SP1060Reader):
         super().__init__(channels, param_name, *args, **kwargs)
         self._channels = channels
         self._param_name = param_name
-        
-        def get_raw(self):
-            output = tuple(chan.parameters[self._param_name].get() for chan in self._channels)
+
+    def get_raw(self):
+        if self._param_name == 'volt' and len(self._channels) > 1:
+            # read all channels with a single query instead of one per channel
+            dac_codes = self._channels[0].root_instrument.query_all_voltage()
+            try:
+                vvals = self._dacvals_to_vvals([dac_codes[chan._channel - 1] for chan in self._channels])
+            except ValueError:
+                self._channels[0].root_instrument._needs_flush = True
+                raise
+            output = tuple(vvals.tolist())
+            # update the channels as their own get would, the next stepped set starts from these values
+            for chan, vval in zip(self._channels, output):
+                chan.volt.cache.set(vval)
             return output
-        
-        def set_raw(self, value):
+        output = tuple(chan.parameters[self._param_name].get() for chan in self._channels)
+        return output
+
+    def set_raw(self, value):
+        if self._param_name == 'volt' and self._within_step(value):
+            # no ramp needed, set all channels at once, but keep the
+            # inter_delay of every channel since its last set
+            wait = max(chan.volt.inter_delay - (time.perf_counter() - chan.volt._t_last_set)
+                       for chan in self._channels)
+            if wait > 0:
+                time.sleep(wait)
+            root = self._channels[0].root_instrument
+            if {chan._channel for chan in self._channels} == set(range(1, 1+root.num_chans)):
+                root.set_all_fast(value)
+            else:
+                root._set_voltages(self._channels, value)
+            t_set = time.perf_counter()
             for chan in self._channels:
-                chan.volt.set(value)
+                chan.volt._t_last_set = t_set
+            return
+        for chan in self._channels:
+            chan.parameters[self._param_name].set(value)
+
+    def _within_step(self, value):
+        """
+        True if no channel has to be ramped to reach value
+        """
+        if len(self._channels) > 1 and not all(chan.volt.cache.valid for chan in self._channels):
+            # refresh all caches with one bulk read instead of a query per channel
+            self.get_raw()
+        for chan in self._channels:
+            step = chan.volt.step
+            if step is not None and abs(value - chan.volt.get_latest()) > step:
+                return False
+        return True
             
     
 class SP1060Channel(InstrumentChannel, SP1060Reader):
@@ -65,15 +120,19 @@ class SP1060Channel(InstrumentChannel, SP1060Reader):
         self._CHANNEL_VAL.validate(channel)
         self._channel = channel
 
+        # command strings of this channel, built once instead of on every set/get
+        self._read_cmd = '{} V?'.format(channel)
+        self._set_prefix = '{} '.format(channel)
+
         # limit voltage range
         self._volt_val = vals.Numbers(min(min_val, max_val), max(min_val, max_val))
         
         self.add_parameter('volt',
                            label = 'C {}'.format(channel),
                            unit = 'V',
-                           set_cmd = partial(self._parent._set_voltage, channel),
+                           set_cmd = partial(self._parent._set_voltage, self._set_prefix),
                            set_parser = self._vval_to_dacval,
-                           get_cmd = partial(self._parent._read_voltage, channel),
+                           get_cmd = partial(self._parent._read_voltage, self._read_cmd),
                            vals = self._volt_val 
                            )
 
@@ -93,23 +152,34 @@ class SP1060(VisaInstrument, SP1060Reader):
             port (str): The address of the DAC. For a serial port this is ASRLn::INSTR
                         where n is replaced with the address set in the VISA control panel.
                         Baud rate and other serial parameters must also be set in the VISA control
-                        panel.
+                        panel. Over the network this is TCPIP0::<ip>::23::SOCKET.
 
             min_val (number): The minimum value in volts that can be output by the DAC.
             max_val (number): The maximum value in volts that can be output by the DAC.
         """
         super().__init__(name, address, **kwargs)
 
-        # Serial port properties
         handle = self.visa_handle
-        handle.baud_rate = baud_rate
-        handle.parity = visa.constants.Parity.none
-        handle.stop_bits = visa.constants.StopBits.one
-        handle.data_bits = 8
-        handle.flow_control = visa.constants.VI_ASRL_FLOW_XON_XOFF
+        self._is_socket = handle.interface_type == visa.constants.InterfaceType.tcpip
+        if self._is_socket:
+            # TCP/IP (telnet) properties
+            # the commands are short, do not let Nagle's algorithm hold them back
+            # (VISA enables this by default, set it explicitly in case it was changed)
+            handle.set_visa_attribute(visa.constants.ResourceAttribute.tcpip_nodelay, True)
+        else:
+            # Serial port properties
+            handle.baud_rate = baud_rate
+            handle.parity = visa.constants.Parity.none
+            handle.stop_bits = visa.constants.StopBits.one
+            handle.data_bits = 8
+            handle.flow_control = visa.constants.VI_ASRL_FLOW_XON_XOFF
         handle.write_termination = '\r\n'
         handle.read_termination = '\r\n'
 
+        # the buffer is only cleared when a reply may have been missed,
+        # start with a clear buffer
+        self._needs_flush = True
+
         # Create channels
         channels = ChannelList(self, 
                                "Channels", 
@@ -118,10 +188,10 @@ class SP1060(VisaInstrument, SP1060Reader):
                                multichan_paramclass = SP1060MultiChannel)
         self.num_chans = 24
         
-        for i in range(1, 1+self.num_chans):
-            channel = SP1060Channel(self, 'chan{:1}'.format(i), i)
-            channels.append(channel)
-            self.add_submodule('ch{:1}'.format(i), channel)
+        chans = [SP1060Channel(self, f'chan{i}', i) for i in range(1, 1+self.num_chans)]
+        channels.extend(chans)
+        for i, channel in enumerate(chans, start=1):
+            self.add_submodule(f'ch{i}', channel)
         channels.lock()
         self.add_submodule('channels', channels)
 
@@ -145,12 +215,25 @@ class SP1060(VisaInstrument, SP1060Reader):
         self.connect_message()
         print('Current DAC output: ' +  str(self.channels[:].volt.get()))
 
-    def _set_voltage(self, chan, code):
-        return self.write('{:0} {:X}'.format(chan, code))
+    def _set_voltage(self, prefix, code):
+        """
+        Write a DAC code to a channel.
+        @prefix - channel part of the command, e.g. '12 '
+        @code - integer DAC value
+        """
+        return self.write(f'{prefix}{code:X}')
             
-    def _read_voltage(self, chan):
-        dac_code=self.write('{:0} V?'.format(chan))
-        return self._dacval_to_vval(dac_code)
+    def _read_voltage(self, read_cmd):
+        """
+        Read the voltage of a channel.
+        @read_cmd - complete query of the channel, e.g. '12 V?'
+        """
+        dac_code=self.write(read_cmd)
+        try:
+            return self._dacval_to_vval(dac_code)
+        except ValueError:
+            self._needs_flush = True
+            raise
 
     def set_all(self, volt):
         """
@@ -158,6 +241,115 @@ class SP1060(VisaInstrument, SP1060Reader):
         """
         for chan in self.channels:
             chan.volt.set(volt)
+
+    def set_all_fast(self, volt):
+        """
+        Set all dac channels to a specific voltage with a single ALL command.
+        Unlike set_all this does not ramp, the step and inter_delay of the
+        channels are bypassed.
+        """
+        for chan in self.channels:
+            chan._volt_val.validate(volt)
+        reply = self._set_voltage('ALL ', self._vval_to_dacval(volt))
+        # keep the parameters in sync, the next stepped set starts from this value
+        for chan in self.channels:
+            chan.volt.cache.set(volt)
+        return reply
+
+    def _combine_commands(self, cmds):
+        """
+        Combine single SET commands to multiple SET command strings (see
+        programmer's manual, chapter 6). A string holds at most 1000 commands,
+        over RS-232 it is also kept within 125 characters since the input
+        buffer of the DAC is only 128 bytes.
+        """
+        max_len = None if self._is_socket else 125
+        batch = []
+        length = 0
+        for cmd in cmds:
+            if batch and (len(batch) == 1000 or
+                          (max_len is not None and length + 1 + len(cmd) > max_len)):
+                yield ';'.join(batch)
+                batch = []
+                length = 0
+            length += len(cmd) + (1 if batch else 0)
+            batch.append(cmd)
+        if batch:
+            yield ';'.join(batch)
+
+    def _set_voltages(self, channels, volt):
+        """
+        Set several channels to a voltage without ramping. The SET commands are
+        combined to multiple SET commands, see _combine_commands.
+        """
+        for chan in channels:
+            chan._volt_val.validate(volt)
+        code = self._vval_to_dacval(volt)
+        cmds = [f'{chan._set_prefix}{code:X}' for chan in channels]
+        replies = []
+        for cmd_string in self._combine_commands(cmds):
+            replies.extend(self.write(cmd_string).split(';'))
+        # keep the parameters in sync, the next stepped set starts from this value
+        for chan in channels:
+            chan.volt.cache.set(volt)
+        return replies
+
+    def ramp_channel(self, chan, v_start, v_end, step=None, delay=None):
+        """
+        Ramp a channel from v_start to v_end in steps of at most step volts.
+        All DAC codes are computed up front; successive writes start at least
+        delay seconds apart. The delay is counted from the start of the previous
+        write, so its round trip overlaps with the delay instead of adding to it.
+        step and delay default to the step and inter_delay of the channel's volt
+        parameter and cannot exceed these safety limits.
+        v_start must lie within the step of the channel's volt parameter from
+        the current output, otherwise the first write would be an unramped jump.
+        @chan - integer indicating channel
+        @v_start - start voltage
+        @v_end - end voltage
+        @step - maximum voltage increment per step, > 0
+        @delay - minimum time in seconds between successive steps
+        """
+        vals.Ints(1, self.num_chans).validate(chan)
+        channel = self.channels[chan - 1]
+        max_step = channel.volt.step
+        min_delay = channel.volt.inter_delay
+        if step is None:
+            step = max_step
+        if delay is None:
+            delay = min_delay
+        if step is None or step <= 0:
+            raise ValueError('step must be positive, got {}'.format(step))
+        if max_step is not None and step > max_step:
+            raise ValueError('step {} exceeds the step of channel {} ({})'.format(step, chan, max_step))
+        if delay < min_delay:
+            raise ValueError('delay {} is below the inter_delay of channel {} ({})'.format(delay, chan, min_delay))
+        channel._volt_val.validate(v_start)
+        channel._volt_val.validate(v_end)
+        current = channel.volt.get_latest()
+        if max_step is not None and abs(v_start - current) > max_step:
+            raise SP1060Exception('Ramp start {} V is more than a step away from '
+                                  'the output of channel {} ({} V)'.format(v_start, chan, current))
+        num_steps = max(int(np.ceil(abs(v_end - v_start)/step)), 1)
+        vvals = np.linspace(v_start, v_end, num_steps + 1)
+        dac_codes = self._vvals_to_dacvals(vvals)
+
+        last_written = None
+        last_write = None
+        try:
+            for vval, code in zip(vvals.tolist(), dac_codes.tolist()):
+                if last_write is not None:
+                    wait = last_write + delay - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                last_write = time.monotonic()
+                self._set_voltage(channel._set_prefix, code)
+                last_written = vval
+        finally:
+            # keep the parameter in sync with the last value actually written,
+            # also when the ramp is interrupted; the next stepped set starts from it
+            if last_written is not None:
+                channel.volt.cache.set(last_written)
     
     def query_all(self):
         """
@@ -188,17 +380,58 @@ class SP1060(VisaInstrument, SP1060Reader):
        #      self.visa_handle.read_raw()
        #     print("... done")
         self.visa_handle.clear() 
+        self._needs_flush = False
+
+    def resync(self):
+        """
+        Clear the buffer of the DAC, e.g. after replies got out of step
+        with the commands.
+        """
+        self.empty_buffer()
           
     def write(self, cmd):
         """
         Since there is always a return code from the instrument, we use ask instead of write
         TODO: interpret the return code (0: no error)
         """
-        # make sure there is nothing in the buffer
-        self.empty_buffer()  
-        
-        return self.ask(cmd)
+        # commands are answered by a single line, so the buffer only has to be
+        # cleared after a reply was missed, garbled, or only partly read
+        # (multi-line queries such as HARD? set _needs_flush themselves)
+        if self._needs_flush:
+            self.empty_buffer()
+        try:
+            return self.ask(cmd)
+        except visa.errors.VisaIOError:
+            self._needs_flush = True
+            raise
     
+    def _ask_multiline(self, cmd, line_timeout=100):
+        """
+        Send a query whose reply spans several lines and return all lines.
+        The reply has no end marker, so lines are read until none arrives
+        within line_timeout milliseconds, bounded by the VISA timeout.
+        """
+        lines = [self.write(cmd)]
+        handle = self.visa_handle
+        timeout = handle.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout/1000
+        handle.timeout = line_timeout
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                try:
+                    lines.append(handle.read())
+                except visa.errors.VisaIOError as e:
+                    if e.error_code != visa.constants.StatusCode.error_timeout:
+                        self._needs_flush = True
+                        raise
+                    break
+            else:
+                # still receiving, do not let the rest shift later replies
+                self._needs_flush = True
+        finally:
+            handle.timeout = timeout
+        return lines
+
     def get_serial(self):
         """
         Returns the serial number of the device
@@ -207,13 +440,7 @@ class SP1060(VisaInstrument, SP1060Reader):
         the first \n received
 
         """
-        self.write('HARD?')
-        reply = self.visa_handle.read()
-        time.sleep(0.01)
-       # while self.visa_handle.bytes_in_buffer:
-       #     self.visa_handle.read_raw()
-       #     time.sleep(0.01)
-        self.empty_buffer()
+        reply = self._ask_multiline('HARD?')[1]
         return reply.strip()[3:]
     
     def get_firmware(self):
@@ -224,13 +451,7 @@ class SP1060(VisaInstrument, SP1060Reader):
         the first \n received
 
         """
-        self.write('SOFT?')
-        reply = self.visa_handle.read()
-        time.sleep(0.01)
-       # while self.visa_handle.bytes_in_buffer:
-       #     self.visa_handle.read_raw()
-       #     time.sleep(0.01)
-        self.empty_buffer()
+        reply = self._ask_multiline('SOFT?')[1]
         return reply.strip()[-5:]
         
     
@@ -242,7 +463,7 @@ class SP1060(VisaInstrument, SP1060Reader):
                         
 
     def set_newWaveform(self, channel = '12', waveform = '0', frequency = '100.0', 
-                        amplitude = '5.0', wavemem = '0'):
+                        amplitude = '5.0', wavemem = '0', write_timeout = 10.0):
         """
         Write the Standard Waveform Function to be generated
         - Channel: [1 ... 24]
@@ -259,6 +480,8 @@ class SP1060(VisaInstrument, SP1060Reader):
         - Frequency: AWG-Frequency [0.001 ... 10.000]
         - Amplitude: [-50.000000 ... 50.000000]
         - Wave-Memory (WAV-A/B/C/D) are represented by 0/1/2/3 respectively
+        - write_timeout: maximum time in seconds to wait for the Wave-Memory
+          to be written to the AWG-Memory
         """
         memsave = ''
         if (wavemem == '0'):
@@ -270,32 +493,29 @@ class SP1060(VisaInstrument, SP1060Reader):
         elif (wavemem == '3'):
             memsave = 'D'
 
-        sleep_time = 0.02
-
-        self.write('C WAV-B CLR') # Wave-Memory Clear.
-        time.sleep(sleep_time)
-        self.write('C SWG MODE 0') # generate new Waveform.
-        time.sleep(sleep_time)
-        self.write('C SWG WF ' + waveform) # set the waveform.
-        time.sleep(sleep_time)
-        self.write('C SWG DF ' + frequency) # set frequency.
-        time.sleep(sleep_time)
-        self.write('C SWG AMP ' + amplitude) # set the amplitude.
-        time.sleep(sleep_time)
-        self.write('C SWG WMEM ' + wavemem) # set the Wave-Memory.
-        time.sleep(sleep_time)
-        self.write('C SWG WFUN 0') # COPY to Wave-MEM -> Overwrite.
-        time.sleep(sleep_time)
-        self.write('C SWG LIN ' + channel) # COPY to Wave-MEM -> Overwrite.
-        time.sleep(sleep_time)
-        self.write('C AWG-' + memsave + ' CH ' + channel) # Write the Selected DAC-Channel for the AWG.
-        time.sleep(sleep_time)
-        self.write('C SWG APPLY') # Apply Wave-Function to Wave-Memory Now.
-        time.sleep(sleep_time)
-        self.write('C WAV-' + memsave + ' SAVE') # Save the selected Wave-Memory (WAV-A/B/C/D) to the internal volatile memory.
-        time.sleep(sleep_time)
-        self.write('C WAV-' + memsave + ' WRITE') # Write the Wave-Memory (WAV-A/B/C/D) to the corresponding AWG-Memory (AWG-A/B/C/D).
-        time.sleep(0.5)
+        # CONTROL commands have to be acknowledged one by one and can be
+        # repeated at a maximum of around 100 Hz (10 msec)
+        for cmd in ('C WAV-B CLR', # Wave-Memory Clear.
+                    'C SWG MODE 0', # generate new Waveform.
+                    'C SWG WF ' + waveform, # set the waveform.
+                    'C SWG DF ' + frequency, # set frequency.
+                    'C SWG AMP ' + amplitude, # set the amplitude.
+                    'C SWG WMEM ' + wavemem, # set the Wave-Memory.
+                    'C SWG WFUN 0', # COPY to Wave-MEM -> Overwrite.
+                    'C SWG LIN ' + channel, # COPY to Wave-MEM -> Overwrite.
+                    'C AWG-' + memsave + ' CH ' + channel, # Write the Selected DAC-Channel for the AWG.
+                    'C SWG APPLY', # Apply Wave-Function to Wave-Memory Now.
+                    'C WAV-' + memsave + ' SAVE', # Save the selected Wave-Memory (WAV-A/B/C/D) to the internal volatile memory.
+                    'C WAV-' + memsave + ' WRITE', # Write the Wave-Memory (WAV-A/B/C/D) to the corresponding AWG-Memory (AWG-A/B/C/D).
+                    ):
+            self.write(cmd)
+            time.sleep(0.01)
+        # the AWG can only be started once the Wave-Memory has been written
+        deadline = time.monotonic() + write_timeout
+        while self.read_WAVBusyWriting(memsave).strip() == '1':
+            if time.monotonic() > deadline:
+                raise SP1060Exception('WAV-{} still busy writing after {} s'.format(memsave, write_timeout))
+            time.sleep(0.01)
         self.write('C AWG-' + memsave + ' START') # Apply Wave-Function to Wave-Memory Now.
 
     def set_bandwidth(self, chan, code):
@@ -336,7 +556,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @voltage - hexadecimal voltage value
     """
     def set_chan_voltage(self, chan, voltage):
-        code = self.write('{:0} {:X}'.format(chan, voltage))
+        code = self.write(f'{chan} {voltage:X}')
         return self.handleDACSetErrors(code) 
 
     """
@@ -344,7 +564,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @voltage - hexadecimal voltage value
     """
     def set_all_voltage(self, voltage):
-        code = self.write('ALL {:X}'.format(voltage))
+        code = self.write(f'ALL {voltage:X}')
         return self.handleDACSetErrors(code) 
     
     """
@@ -411,10 +631,10 @@ class SP1060(VisaInstrument, SP1060Reader):
     @value - hexadecimal value of voltage
     """
     def set_adr_AWGmem(self, mem, adr, value):
-        code = self.write("AWG-{} {:X} {:X}".format(mem, adr, value))
+        code = self.write(f"AWG-{mem} {adr:X} {value:X}")
 
     def set_all_AWGMem(self, mem, value):
-        code = self.write("AWG-{} ALL {:X}".format(mem, value))
+        code = self.write(f"AWG-{mem} ALL {value:X}")
 
 #### All WAV SET Commands return a numeric response:
     """
@@ -430,13 +650,30 @@ class SP1060(VisaInstrument, SP1060Reader):
     Set a WAV-memory address to a value
     @mem - character specifiying WAV-memory
     @adr - hecadecimal address
-    @value - hexadecimal value of voltage
+    @value - voltage [-10 ... 10], sent as a decimal number
     """
     def set_adr_WAVMem(self, mem, adr, value):
-        code = self.write("WAV-{0} {:X} {:X}".format(mem, adr, value))
+        code = self.write(f"WAV-{mem} {adr:X} {value:.6f}")
 
     def set_all_WAVMem(self, mem, value):
-        code = self.write("WAV-{0} ALL {:X}".format(mem, value))
+        code = self.write(f"WAV-{mem} ALL {value:.6f}")
+
+    """
+    Upload a waveform to a WAV-memory, starting at address 0. The samples are
+    sent as multiple SET WAVE commands, so one command string carries many
+    samples instead of one. Clear the memory first to drop older samples.
+    @mem - character specifiying WAV-memory
+    @samples - sequence of voltages [-10 ... 10]
+    Returns the error codes of the single SET WAVE commands.
+    """
+    def upload_wave(self, mem, samples):
+        samples = np.asarray(samples, dtype=float)
+        vals.Arrays(min_value=-10, max_value=10).validate(samples)
+        cmds = [f'WAV-{mem} {adr:X} {volt:.6f}' for adr, volt in enumerate(samples.tolist())]
+        replies = []
+        for cmd_string in self._combine_commands(cmds):
+            replies.extend(self.write(cmd_string).split(';'))
+        return replies
 
 #### POLY command return codes:
     """
@@ -473,8 +710,16 @@ class SP1060(VisaInstrument, SP1060Reader):
         return self._dacval_to_vval(dac_code)
 
     def query_all_voltage(self):
-        dac_code=self.write('ALL V?')
-        return dac_code
+        """
+        Read the DAC codes of all channels with a single query.
+        Returns a list of 24 hexadecimal strings, one per channel.
+        """
+        reply = self.write('ALL V?')
+        dac_codes = [code for code in reply.replace("\r\n","").split(';') if code.strip()]
+        if len(dac_codes) != self.num_chans:
+            self._needs_flush = True
+            raise SP1060Exception('Unexpected reply to ALL V?: {}'.format(reply))
+        return dac_codes
 
     """
     Read the registered voltage of a specified channel
@@ -537,7 +782,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @adr - hex number indicating address
     """
     def query_adr_AWGmem(self, mem, adr):
-        reply = self.write('AWG-{0} {:X}?'.format(mem, adr))
+        reply = self.write(f'AWG-{mem} {adr:X}?')
         return reply
 
     """
@@ -546,7 +791,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @block_start - hex number indicating start address
     """
     def query_block_AWGmem(self, mem, block_start):
-        reply = self.write('AWG-{0} {:X} BLK?'.format(mem, block_start))
+        reply = self.write(f'AWG-{mem} {block_start:X} BLK?')
         return reply.replace("\r\n","").split(';')
 
     """
@@ -555,7 +800,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @adr - hex number indicating address
     """
     def query_adr_WAVmem(self, mem, adr):
-        reply = self.write('WAV-{0} {:X}?'.format(mem, adr))
+        reply = self.write(f'WAV-{mem} {adr:X}?')
         return reply
 
     """
@@ -564,7 +809,7 @@ class SP1060(VisaInstrument, SP1060Reader):
     @block_start - hex number indicating start address
     """
     def query_block_WAVmem(self, mem, block_start):
-        reply = self.write('WAV-{0} {:X} BLK?'.format(mem, block_start))
+        reply = self.write(f'WAV-{mem} {block_start:X} BLK?')
         return reply.replace("\r\n","").split(';')
 
     """
@@ -589,48 +834,42 @@ class SP1060(VisaInstrument, SP1060Reader):
         the first \n received
 
         """
-        self.write('HARD?')
-        reply = self.visa_handle.read()
-        time.sleep(0.01)
-       # while self.visa_handle.bytes_in_buffer:
-       #     self.visa_handle.read_raw()
-       #     time.sleep(0.01)
-        self.empty_buffer()
+        reply = self._ask_multiline('HARD?')[1]
         return reply.strip()[3:]
 
     """
     Returns overview of the ASCII commands and queries
     """
     def get_overview(self):
-        reply = self.write('?')
+        reply = '\n'.join(self._ask_multiline('?'))
         return reply
 
     """
     Shows the help text
     """
     def get_help(self):
-        reply = self.write("HELP?")
+        reply = '\n'.join(self._ask_multiline("HELP?"))
         return reply
 
     """
     Shows the health of the device (temperature, cpu-load, power-supplies)
     """
     def get_health(self):
-        reply = self.write("HEALTH?")
+        reply = '\n'.join(self._ask_multiline("HEALTH?"))
         return reply
 
     """
     Obtains the IP address of the DAC
     """
     def get_ip(self):
-        reply = self.write("IP?")
+        reply = '\n'.join(self._ask_multiline("IP?"))
         return reply
 
     """
     Provides contact information (name, lab, website, email. phone)
     """
     def get_contact(self):
-        reply = self.write("CONTACT?")
+        reply = '\n'.join(self._ask_multiline("CONTACT?"))
         return reply
 
     
@@ -642,13 +881,7 @@ class SP1060(VisaInstrument, SP1060Reader):
         the first \n received
 
         """
-        self.write('SOFT?')
-        reply = self.visa_handle.read()
-        time.sleep(0.01)
-       # while self.visa_handle.bytes_in_buffer:
-       #     self.visa_handle.read_raw()
-       #     time.sleep(0.01)
-        self.empty_buffer()
+        reply = self._ask_multiline('SOFT?')[1]
         return reply.strip()[-5:]
         
     """